@@ -13,6 +13,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Optional, Tuple, Iterable
 
 import plyvel
@@ -25,6 +27,9 @@ from ..icon_constant import ICON_DB_LOG_TAG, IconScoreContextType
 if TYPE_CHECKING:
     from ..iconscore.icon_score_context import IconScoreContext
 
+# Marks a key which is not in the cache, as None is a valid cached value
+_CACHE_MISS = object()
+
 
 def _is_db_writable_on_context(context: 'IconScoreContext'):
     """Check if db is writable on a given context
@@ -41,30 +46,59 @@ def _is_db_writable_on_context(context: 'IconScoreContext'):
 class KeyValueDatabase(object):
     @staticmethod
     def from_path(path: str,
-                  create_if_missing: bool = True) -> 'KeyValueDatabase':
+                  create_if_missing: bool = True,
+                  cache_size: int = 0) -> 'KeyValueDatabase':
         """
 
         :param path: db path
         :param create_if_missing:
+        :param cache_size: the maximum number of values kept in the read cache (0: disabled)
         :return: KeyValueDatabase instance
         """
         db = plyvel.DB(path, create_if_missing=create_if_missing)
-        return KeyValueDatabase(db)
+        return KeyValueDatabase(db, cache_size)
 
-    def __init__(self, db: plyvel.DB) -> None:
+    def __init__(self, db: plyvel.DB, cache_size: int = 0) -> None:
         """Constructor
 
         :param db: plyvel db instance
+        :param cache_size: the maximum number of values kept in the read cache (0: disabled)
         """
         self._db = db
 
+        # Write-through LRU cache shared across blocks
+        # All writes to db must be done with this instance to keep the cache coherent
+        self._cache_size: int = cache_size
+        self._cache: 'OrderedDict[bytes, Optional[bytes]]' = OrderedDict()
+        # Invoke, query and validation threads share the state db
+        self._cache_lock = threading.Lock()
+        # Increased on every write to prevent a value read before the write from being cached
+        self._cache_generation: int = 0
+
     def get(self, key: bytes) -> bytes:
         """Get the value for the specified key.
 
         :param key: (bytes): key to retrieve
         :return: value for the specified key, or None if not found
         """
-        return self._db.get(key)
+        if self._cache_size <= 0:
+            return self._db.get(key)
+
+        with self._cache_lock:
+            value: Optional[bytes] = self._cache.get(key, _CACHE_MISS)
+            if value is not _CACHE_MISS:
+                self._cache.move_to_end(key)
+                return value
+
+            generation: int = self._cache_generation
+
+        value: Optional[bytes] = self._db.get(key)
+
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._put_to_cache(key, value)
+
+        return value
 
     def put(self, key: bytes, value: bytes) -> None:
         """Set a value for the specified key.
@@ -73,6 +107,7 @@ class KeyValueDatabase(object):
         :param value: (bytes): data to be stored
         """
         self._db.put(key, value)
+        self._update_cache(((key, value),))
 
     def delete(self, key: bytes) -> None:
         """Delete the key/value pair for the specified key.
@@ -80,10 +115,38 @@ class KeyValueDatabase(object):
         :param key: key to delete
         """
         self._db.delete(key)
+        self._update_cache(((key, None),))
+
+    def _update_cache(self, it: Iterable[Tuple[bytes, Optional[bytes]]]) -> None:
+        """Applies the key-value pairs which have just been written to db to the cache
+
+        :param it: iterable which return tuple(key, value)
+        """
+        if self._cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache_generation += 1
+
+            for key, value in it:
+                self._put_to_cache(key, value)
+
+    def _put_to_cache(self, key: bytes, value: Optional[bytes]) -> None:
+        """Caller must hold self._cache_lock
+        """
+        cache = self._cache
+        cache[key] = value
+        cache.move_to_end(key)
+
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
 
     def close(self) -> None:
         """Close the database.
         """
+        with self._cache_lock:
+            self._cache.clear()
+
         if self._db:
             self._db.close()
             self._db = None
@@ -91,6 +154,8 @@ class KeyValueDatabase(object):
     def get_sub_db(self, prefix: bytes) -> 'KeyValueDatabase':
         """Return a new prefixed database.
 
+        The returned database does not share the read cache with this one
+
         :param prefix: (bytes): prefix to use
         """
         return KeyValueDatabase(self._db.prefixed_db(prefix))
@@ -111,15 +176,24 @@ class KeyValueDatabase(object):
         if it is None:
             return size
 
+        use_cache: bool = self._cache_size > 0
+        written: list = []
+
         with self._db.write_batch() as wb:
             for key, value in it:
                 if value:
                     wb.put(key, value)
                 else:
                     wb.delete(key)
+                    value = None
 
+                if use_cache:
+                    written.append((key, value))
                 size += 1
 
+        # Update the cache only after the batch has been written to db successfully
+        self._update_cache(written)
+
         return size
 
 
@@ -55,6 +55,10 @@ _OFFSET_INSTANT_BLOCK_HASH = _OFFSET_STATE + 4
 _OFFSET_LOG_COUNT = _OFFSET_INSTANT_BLOCK_HASH + 32
 _OFFSET_LOG_START_OFFSETS = _OFFSET_LOG_COUNT + 4
 
+# Only file data (and the size needed to read it back) has to be durable for recovery,
+# so skip the extra inode metadata flush of fsync() where fdatasync() is available
+_sync_file_data = getattr(os, "fdatasync", os.fsync)
+
 
 class WALDBType(Enum):
     RC = 0
@@ -220,7 +224,7 @@ class WriteAheadLogWriter(object):
 
         if fp:
             fp.flush()
-            os.fsync(fp.fileno())
+            _sync_file_data(fp.fileno())
 
     def close(self):
         if self._fp:
@@ -22,7 +22,7 @@ from .icon_constant import (
     ConfigKey, TERM_PERIOD, IISS_DAY_BLOCK, PREP_MAIN_PREPS,
     PREP_MAIN_AND_SUB_PREPS, PENALTY_GRACE_PERIOD, LOW_PRODUCTIVITY_PENALTY_THRESHOLD,
     BLOCK_VALIDATION_PENALTY_THRESHOLD, BACKUP_FILES, BLOCK_INVOKE_TIMEOUT_S,
-    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX)
+    IISS_INITIAL_IREP, PREP_REGISTRATION_FEE, UNSTAKE_SLOT_MAX, STATE_DB_CACHE_SIZE)
 
 _TAG = "CFG"
 ConfigValue = Union[bool, dict, float, int, str]
@@ -77,6 +77,7 @@ default_icon_config = {
     ConfigKey.BLOCK_INVOKE_TIMEOUT: BLOCK_INVOKE_TIMEOUT_S,
     ConfigKey.TBEARS_MODE: False,
     ConfigKey.UNSTAKE_SLOT_MAX: UNSTAKE_SLOT_MAX,
+    ConfigKey.STATE_DB_CACHE_SIZE: STATE_DB_CACHE_SIZE,
 }
 
 
@@ -229,6 +229,9 @@ class ConfigKey:
 
     UNSTAKE_SLOT_MAX = "unstakeSlotMax"
 
+    # The maximum number of values kept in the state db read cache (0: disabled)
+    STATE_DB_CACHE_SIZE = "stateDbCacheSize"
+
     # The list of items(address, unstake, unstake_block_height)
     # containing invalid expired unstakes to remove
     INVALID_EXPIRED_UNSTAKES_PATH = "invalidExpiredUnstakesPath"
@@ -362,6 +365,8 @@ BACKUP_FILES = 10
 
 BLOCK_INVOKE_TIMEOUT_S = 15
 
+STATE_DB_CACHE_SIZE = 0
+
 
 class RCStatus(IntEnum):
     NOT_READY = 0
@@ -166,7 +166,9 @@ class IconServiceEngine(ContextContainer):
         os.makedirs(backup_root_path, exist_ok=True)
 
         # Share one context db with all SCORE
-        ContextDatabaseFactory.open(state_db_root_path, ContextDatabaseFactory.Mode.SINGLE_DB)
+        ContextDatabaseFactory.open(state_db_root_path,
+                                    ContextDatabaseFactory.Mode.SINGLE_DB,
+                                    conf[ConfigKey.STATE_DB_CACHE_SIZE])
         self._state_db_root_path = state_db_root_path
         self._rc_data_path = rc_data_path
         self._backup_root_path = backup_root_path
@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
 import time
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple
@@ -110,6 +111,10 @@ class Engine(EngineBase):
         self._reward_calc_proxy: Optional['RewardCalcProxy'] = None
         self._listeners: List['IISSEngineListener'] = []
 
+        # getStake responses on the state of the block indicated by _stake_cache_block_hash
+        self._stake_cache_block_hash: Optional[bytes] = None
+        self._stake_cache: Dict['Address', dict] = {}
+
     def open(self, context: 'IconScoreContext',
              log_dir: str, data_path: str, socket_path: str, ipc_timeout: int,
              icon_rc_path: str, icon_rc_monitor: bool):
@@ -252,6 +257,10 @@ class Engine(EngineBase):
     def close(self):
         self._close_reward_calc_proxy()
 
+    def rollback(self, context: 'IconScoreContext', block_height: int, block_hash: bytes):
+        self._stake_cache_block_hash = None
+        self._stake_cache = {}
+
     @classmethod
     def check_method(cls, method: str) -> bool:
         return method in cls.METHOD_TABLE
@@ -346,8 +355,24 @@ class Engine(EngineBase):
         second_operand: float = (stake_percentage - (rpoint / IISS_MAX_REWARD_RATE)) ** 2
         return int(first_operand * second_operand) + lmin
 
+    def handle_get_stake(self, context: 'IconScoreContext', address: "Address") -> dict:
+        # The committed state of a given block never changes, so the response can be reused on queries
+        if context.type != IconScoreContextType.QUERY or context.block.hash is None:
+            return self._get_stake(context, address)
+
+        if self._stake_cache_block_hash != context.block.hash:
+            self._stake_cache = {}
+            self._stake_cache_block_hash = context.block.hash
+
+        data: Optional[dict] = self._stake_cache.get(address)
+        if data is None:
+            data = self._get_stake(context, address)
+            self._stake_cache[address] = data
+
+        return copy.deepcopy(data)
+
     @staticmethod
-    def handle_get_stake(context: 'IconScoreContext', address: "Address") -> dict:
+    def _get_stake(context: 'IconScoreContext', address: "Address") -> dict:
         account: "Account" = context.storage.icx.get_account(
             context, address, Intent.STAKE
         )
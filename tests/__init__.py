@@ -23,6 +23,7 @@ import os
 import random
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 
 from iconcommons.logger import Logger
@@ -43,11 +44,13 @@ def create_address(prefix: int = 0, data: bytes = None) -> 'Address':
     return Address(AddressPrefix(prefix), hash_value[-20:])
 
 
+_MAX_RANDOM_INT = sys.maxsize
+_MAX_RANDOM_INT_SIZE = (_MAX_RANDOM_INT.bit_length() + 7) // 8
+
+
 def create_hash_256(data: bytes = None) -> bytes:
     if data is None:
-        max_int = sys.maxsize
-        length = (max_int.bit_length() + 7) // 8
-        data = int(random.randint(0, max_int)).to_bytes(length, DATA_BYTE_ORDER)
+        data = random.randint(0, _MAX_RANDOM_INT).to_bytes(_MAX_RANDOM_INT_SIZE, DATA_BYTE_ORDER)
 
     return hashlib.sha3_256(data).digest()
 
@@ -79,10 +82,13 @@ def rmtree(path: str) -> None:
 
 
 def root_clear(score_path: str, state_db_path: str, iiss_db_path: str, precommit_log_path: str):
-    rmtree(score_path)
-    rmtree(state_db_path)
-    rmtree(iiss_db_path)
-    rmtree(precommit_log_path)
+    """Removes the given directories concurrently
+
+    The directories must not be nested in each other
+    """
+    paths = (score_path, state_db_path, iiss_db_path, precommit_log_path)
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        list(executor.map(rmtree, paths))
 
 
 def remove_unstake_report():
@@ -98,14 +98,13 @@ class TestPreps(TestIISSBase):
         self.make_blocks_to_end_calculation()
 
         # get main prep list
-        expected_preps: list = []
+        expected_preps: list = [{"address": self._accounts[PREP_MAIN_PREPS].address,
+                                 "delegated": delegation_amount}]
         for i in range(1, PREP_MAIN_PREPS):
             expected_preps.append({
                 "address": self._accounts[i].address,
                 "delegated": 0
             })
-        expected_preps.insert(0, {"address": self._accounts[PREP_MAIN_PREPS].address,
-                                  "delegated": delegation_amount})
 
         response: dict = self.get_main_prep_list()
         expected_response: dict = \
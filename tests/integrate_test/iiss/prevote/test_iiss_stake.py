@@ -16,7 +16,9 @@
 
 """IconScoreEngine testcase
 """
-from typing import TYPE_CHECKING, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from unittest.mock import patch
 
 from iconservice import SYSTEM_SCORE_ADDRESS
@@ -25,6 +27,7 @@ from tests.integrate_test.iiss.test_iiss_base import TestIISSBase
 
 if TYPE_CHECKING:
     from iconservice.iconscore.icon_score_result import TransactionResult
+    from tests.integrate_test.test_integrate_base import EOAAccount
 
 
 class TestIISSStake(TestIISSBase):
@@ -74,188 +77,43 @@ class TestIISSStake(TestIISSBase):
         self.distribute_icx(accounts=self._accounts[:1],
                             init_balance=balance)
 
-        # set stake 50 icx
-        stake: int = 50 * ICX_IN_LOOP
-        unstake: int = 0
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": stake
-        }
-        self.assertEqual(expected_response, actual_response)
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 100 icx
-        stake: int = 100 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": stake,
-        }
-        self.assertEqual(expected_response, actual_response)
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 50 icx again
-        stake: int = 50 * ICX_IN_LOOP
-        unstake: int = 50 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        estimate_unstake_lock_period_response: dict = self.estimate_unstake_lock_period()
-        expected_response = {
-            "stake": stake,
-            "unstake": unstake
-        }
-        self.assertEqual(expected_response['stake'], actual_response['stake'])
-        self.assertEqual(expected_response['unstake'], actual_response['unstake'])
-        self.assertIn('unstakeBlockHeight', actual_response)
-        self.assertEqual(estimate_unstake_lock_period_response["unstakeLockPeriod"],
-                         actual_response["remainingBlocks"])
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 100 icx again
-        stake: int = 100 * ICX_IN_LOOP
-        unstake: int = 0 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": stake
-        }
-        self.assertEqual(expected_response, actual_response)
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 50 icx again
-        stake: int = 50 * ICX_IN_LOOP
-        unstake: int = 50 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        estimate_unstake_lock_period_response: dict = self.estimate_unstake_lock_period()
-        expected_response = {
-            "stake": stake,
-            "unstake": unstake
-        }
-        self.assertEqual(expected_response['stake'], actual_response['stake'])
-        self.assertEqual(expected_response['unstake'], actual_response['unstake'])
-        self.assertIn('unstakeBlockHeight', actual_response)
-        self.assertEqual(estimate_unstake_lock_period_response["unstakeLockPeriod"],
-                         actual_response["remainingBlocks"])
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 150 icx
-        stake: int = 150 * ICX_IN_LOOP
-        unstake: int = 0 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": stake
-        }
-        self.assertEqual(expected_response, actual_response)
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 50 icx
-        stake: int = 50 * ICX_IN_LOOP
-        unstake: int = 100 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        estimate_unstake_lock_period_response: dict = self.estimate_unstake_lock_period()
-        expected_response = {
-            "stake": stake,
-            "unstake": unstake
-        }
-        self.assertEqual(expected_response['stake'], actual_response['stake'])
-        self.assertEqual(expected_response['unstake'], actual_response['unstake'])
-        self.assertIn('unstakeBlockHeight', actual_response)
-        self.assertEqual(estimate_unstake_lock_period_response["unstakeLockPeriod"],
-                         actual_response["remainingBlocks"])
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
-
-        # set stake 0 icx
-        stake: int = 0 * ICX_IN_LOOP
-        unstake: int = 150 * ICX_IN_LOOP
-        total_stake = stake + unstake
-        tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
-                                                               value=stake)
-        balance -= tx_results[0].step_used * tx_results[0].step_price
-
-        # get stake
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": stake,
-            "unstake": unstake,
-        }
-        self.assertEqual(expected_response['stake'], actual_response['stake'])
-        self.assertEqual(expected_response['unstake'], actual_response['unstake'])
-        self.assertIn('unstakeBlockHeight', actual_response)
-
-        # get balance
-        remain_balance: int = balance - total_stake
-        actual_balance: int = self.get_balance(self._accounts[0])
-        self.assertEqual(remain_balance, actual_balance)
+        # (stake, unstake) in icx after each setStake
+        scenarios: List[Tuple[int, int]] = [
+            (50, 0),
+            (100, 0),
+            (50, 50),
+            (100, 0),
+            (50, 50),
+            (150, 0),
+            (50, 100),
+            (0, 150),
+        ]
+
+        # Each step builds on the balance and stake left by the previous one,
+        # so the scenarios are run in order and the first failure ends the test
+        for stake, unstake in scenarios:
+            stake *= ICX_IN_LOOP
+            unstake *= ICX_IN_LOOP
+            msg: str = f"stake={stake} unstake={unstake}"
+
+            tx_results: List['TransactionResult'] = self.set_stake(from_=self._accounts[0],
+                                                                   value=stake)
+            balance -= tx_results[0].step_used * tx_results[0].step_price
+
+            # remainingBlocks is not checked when all icx are unstaked
+            actual_response: dict = self._assert_stake(self._accounts[0], stake, unstake,
+                                                       check_remaining_blocks=stake > 0,
+                                                       msg=msg)
+
+            # get balance
+            remain_balance: int = balance - (stake + unstake)
+            actual_balance: int = self.get_balance(self._accounts[0])
+            self.assertEqual(remain_balance, actual_balance, msg)
 
         expired_block_height: int = actual_response['unstakeBlockHeight']
-        self.make_blocks(expired_block_height + 1)
+        # Unstaked icx is released lazily on the first access after the lock period,
+        # so blocks without any transactions are enough to get there
+        self.make_empty_blocks(expired_block_height + 1 - self._block_height)
 
         # after unstake_lock_period
         remain_balance: int = balance
@@ -280,11 +138,31 @@ class TestIISSStake(TestIISSBase):
         self.process_confirm_block_tx([tx])
 
         # get balance
-        actual_response: dict = self.get_stake(self._accounts[0])
-        expected_response = {
-            "stake": 0
-        }
-        self.assertEqual(expected_response, actual_response)
+        self._assert_stake(self._accounts[0], stake=0, unstake=0)
+
+    def _assert_stake(self,
+                      account: 'EOAAccount',
+                      stake: int,
+                      unstake: int,
+                      check_remaining_blocks: bool = True,
+                      msg: Optional[str] = None) -> dict:
+        actual_response: dict = self.get_stake(account)
+
+        if unstake == 0:
+            self.assertEqual({"stake": stake}, actual_response, msg)
+            return actual_response
+
+        self.assertEqual(stake, actual_response['stake'], msg)
+        self.assertEqual(unstake, actual_response['unstake'], msg)
+        self.assertIn('unstakeBlockHeight', actual_response, msg)
+
+        if check_remaining_blocks:
+            estimate_unstake_lock_period_response: dict = self.estimate_unstake_lock_period()
+            self.assertEqual(estimate_unstake_lock_period_response["unstakeLockPeriod"],
+                             actual_response["remainingBlocks"],
+                             msg)
+
+        return actual_response
 
     def test_unstake(self):
         self.update_governance()
@@ -28,6 +28,7 @@ from iconservice.iiss import IISSMethod
 from iconservice.prep import PRepMethod
 from iconservice.prep.data import Term
 from iconservice.utils import icx_to_loop
+from tests import create_timestamp, create_tx_hash
 from tests.integrate_test.test_integrate_base import TestIntegrateBase, TOTAL_SUPPLY, MINIMUM_STEP_LIMIT
 
 if TYPE_CHECKING:
@@ -61,9 +62,21 @@ class TestIISSBase(TestIntegrateBase):
             -> List[List['TransactionResult']]:
         block_height = self._block_height
         tx_results: List[List['TransactionResult']] = []
+        if to <= block_height:
+            return tx_results
+
+        # Every block has the same dummy transfer tx, so create and validate it only once
+        # and stamp a new timestamp and txHash for each block
+        dummy_tx: dict = self.create_transfer_icx_tx(self._admin, self._genesis, 0)
 
         while to > block_height:
-            tx = self.create_transfer_icx_tx(self._admin, self._genesis, 0)
+            params: dict = dict(dummy_tx["params"])
+            params["timestamp"] = create_timestamp()
+            params["txHash"] = create_tx_hash()
+            tx = {
+                "method": dummy_tx["method"],
+                "params": params
+            }
             tx_results.append(self.process_confirm_block_tx([tx],
                                                             prev_block_generator=prev_block_generator,
                                                             prev_block_validators=prev_block_validators,
@@ -389,6 +402,26 @@ class TestIISSBase(TestIntegrateBase):
                                              prev_block_generator=prev_block_generator,
                                              prev_block_validators=prev_block_validators)
 
+    def set_stakes(self,
+                   params: List[Tuple[Union['EOAAccount', 'Address'], int]],
+                   expected_status: bool = True,
+                   prev_block_generator: Optional['Address'] = None,
+                   prev_block_validators: Optional[List['Address']] = None) -> List['TransactionResult']:
+        """Sets stakes of several accounts in one block
+
+        :param params: list of (account, stake)
+        """
+        tx_list: List[dict] = []
+        for from_, value in params:
+            tx: dict = self.create_set_stake_tx(from_=from_,
+                                                value=value)
+            tx_list.append(tx)
+
+        return self.process_confirm_block_tx(tx_list,
+                                             expected_status=expected_status,
+                                             prev_block_generator=prev_block_generator,
+                                             prev_block_validators=prev_block_validators)
+
     def set_delegation(self,
                        from_: Union['EOAAccount', 'Address'],
                        origin_delegations: List[Tuple[Union['EOAAccount', 'Address'], int]],
@@ -482,12 +515,8 @@ class TestIISSBase(TestIntegrateBase):
 
         # stake PREP_MAIN_PREPS ~ PREP_MAIN_PREPS + PREP_MAIN_PREPS - 1
         stake_amount: int = minimum_delegate_amount_for_decentralization
-        tx_list: list = []
-        for i in range(PREP_MAIN_PREPS):
-            tx: dict = self.create_set_stake_tx(from_=self._accounts[PREP_MAIN_PREPS + i],
-                                                value=stake_amount)
-            tx_list.append(tx)
-        self.process_confirm_block_tx(tx_list)
+        self.set_stakes([(account, stake_amount)
+                         for account in self._accounts[PREP_MAIN_PREPS:PREP_MAIN_PREPS * 2]])
 
         # distribute 3000 icx to the self._accounts
         # which range from 0 to PREP_MAIN_PREPS, exclusive
@@ -578,11 +607,7 @@ class TestIISSBase(TestIntegrateBase):
         max_expired_block_height: int = self._config[ConfigKey.IISS_META_DATA][ConfigKey.UN_STAKE_LOCK_MAX]
         self.make_blocks(self._block_height + max_expired_block_height + 1)
 
-        tx_list: list = []
-        for account in self._accounts:
-            tx: dict = self.create_set_stake_tx(from_=account, value=0)
-            tx_list.append(tx)
-        self.process_confirm_block_tx(tx_list)
+        self.set_stakes([(account, 0) for account in self._accounts])
 
         tx_list: list = []
         step_price: int = self.get_step_price()
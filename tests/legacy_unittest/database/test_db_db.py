@@ -17,8 +17,11 @@
 
 import os
 import unittest
+from typing import Optional
 from unittest.mock import patch
 
+import plyvel
+
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import DatabaseException, InvalidParamsException
 from iconservice.database.batch import BlockBatch, TransactionBatch, TransactionBatchValue, BlockBatchValue
@@ -67,6 +70,82 @@ class TestKeyValueDatabase(unittest.TestCase):
         self.assertEqual(b'value1', db.get(b'key1'))
         self.assertEqual(b'value0', db.get(b'key0'))
 
+    def _reopen_with_cache(self, cache_size: int) -> 'SpyPlyvelDB':
+        self.db.close()
+        spy_db = SpyPlyvelDB(plyvel.DB(self.state_db_root_path, create_if_missing=True))
+        self.db = KeyValueDatabase(spy_db, cache_size)
+        return spy_db
+
+    def test_write_through_cache(self):
+        spy_db = self._reopen_with_cache(cache_size=2)
+        db = self.db
+
+        db.put(b'key0', b'value0')
+        self.assertEqual(b'value0', db.get(b'key0'))
+        self.assertIsNone(db.get(b'key1'))
+        self.assertEqual(1, spy_db.get_count)
+
+        data = {
+            b'key0': BlockBatchValue(None, True, [-1]),
+            b'key1': BlockBatchValue(b'value1', True, [-1])
+        }
+        db.write_batch(StateWAL(data))
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(b'value1', db.get(b'key1'))
+        self.assertEqual(1, spy_db.get_count)
+
+        # key0 is evicted as the least recently used one
+        db.put(b'key2', b'value2')
+        self.assertEqual(b'value1', db.get(b'key1'))
+        self.assertEqual(b'value2', db.get(b'key2'))
+        self.assertEqual(1, spy_db.get_count)
+        self.assertIsNone(db.get(b'key0'))
+        self.assertEqual(2, spy_db.get_count)
+
+        db.delete(b'key2')
+        self.assertIsNone(db.get(b'key2'))
+        self.assertEqual(2, spy_db.get_count)
+
+    def test_write_batch_during_cache_miss(self):
+        self.db.put(b'key0', b'old')
+
+        spy_db = self._reopen_with_cache(cache_size=2)
+        db = self.db
+
+        # Another thread commits a new value after the old one has been read from db on a cache miss
+        data = {b'key0': BlockBatchValue(b'new', True, [-1])}
+        spy_db.on_get = lambda: db.write_batch(StateWAL(data))
+
+        self.assertEqual(b'old', db.get(b'key0'))
+        self.assertEqual(1, spy_db.get_count)
+
+        # The old value must not overwrite the committed one in the cache
+        self.assertEqual(b'new', db.get(b'key0'))
+        self.assertEqual(1, spy_db.get_count)
+
+
+class SpyPlyvelDB(object):
+    """Counts get() calls on a plyvel db and optionally runs a callback right after reading a value
+    """
+
+    def __init__(self, db: 'plyvel.DB'):
+        self._db = db
+        self.get_count: int = 0
+        self.on_get: Optional[callable] = None
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        self.get_count += 1
+        value: Optional[bytes] = self._db.get(key)
+
+        on_get, self.on_get = self.on_get, None
+        if on_get:
+            on_get()
+
+        return value
+
+    def __getattr__(self, name: str):
+        return getattr(self._db, name)
+
 
 class TestContextDatabaseOnWriteMode(unittest.TestCase):
     def setUp(self):
@@ -25,7 +25,7 @@ import pytest
 from iconservice.base.address import Address, AddressPrefix
 from iconservice.base.exception import InvalidParamsException, InvalidRequestException
 from iconservice.base.message import Message
-from iconservice.icon_constant import IISS_DAY_BLOCK, Revision
+from iconservice.icon_constant import IISS_DAY_BLOCK, Revision, IconScoreContextType
 from iconservice.iconscore.icon_score_context import IconScoreContext
 from iconservice.icx.coin_part import CoinPart
 from iconservice.icx.delegation_part import DelegationPart
@@ -608,6 +608,44 @@ class TestIissEngine:
         with pytest.raises(InvalidParamsException):
             engine.invoke(context, "stake", {})
 
+    def test_handle_get_stake_with_cache(self):
+        context = Mock(spec=IconScoreContext)
+        context.type = IconScoreContextType.QUERY
+        context.revision = Revision.IISS.value
+        context.block = Mock(height=1024, hash=b'block_hash_0')
+        context.storage.icx.get_account = Mock(
+            return_value=create_account(
+                address=SENDER_ADDRESS, balance=0,
+                stake=100, unstake=10, unstake_block_height=2048,
+                delegated_amount=0, delegations=[]))
+
+        engine = IISSEngine()
+        expected = {
+            "stake": 100,
+            "unstake": 10,
+            "unstakeBlockHeight": 2048,
+            "remainingBlocks": 1024
+        }
+
+        # The response is reused on the same block
+        for _ in range(3):
+            assert engine.handle_get_stake(context, SENDER_ADDRESS) == expected
+        assert context.storage.icx.get_account.call_count == 1
+
+        # The response must not be shared between callers
+        engine.handle_get_stake(context, SENDER_ADDRESS)["stake"] = 0
+        assert engine.handle_get_stake(context, SENDER_ADDRESS) == expected
+
+        # A new block invalidates the cache
+        context.block = Mock(height=1025, hash=b'block_hash_1')
+        engine.handle_get_stake(context, SENDER_ADDRESS)
+        assert context.storage.icx.get_account.call_count == 2
+
+        # The cache is not used on invoke
+        context.type = IconScoreContextType.INVOKE
+        engine.handle_get_stake(context, SENDER_ADDRESS)
+        assert context.storage.icx.get_account.call_count == 3
+
 
 if __name__ == '__main__':
     unittest.main()